@@ -5,18 +5,143 @@ Fetches data from https://www.mvg.de/api/bgw-pt/v3/messages and returns only INC
 """
 
 import json
+import os
 import re
 import sys
-from datetime import datetime
-from typing import Any, Dict, List
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from html import unescape
+from typing import Any, Dict, List, Optional
 
 import requests
+from urllib3.util.retry import Retry
+
+try:
+    # Optional accelerator: parses the raw response bytes directly,
+    # skipping the intermediate str decode of response.json()
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    # Advertise brotli only when we can actually decode it
+    import brotli  # noqa: F401
+
+    _ACCEPT_ENCODING = "gzip, deflate, br"
+except ImportError:
+    _ACCEPT_ENCODING = "gzip, deflate"
+
+# Compressed transfer shrinks the JSON payload (repeated field names compress
+# well) and the explicit Accept/User-Agent identify the client properly
+_HEADERS = {
+    "Accept": "application/json",
+    "Accept-Encoding": _ACCEPT_ENCODING,
+    "User-Agent": "mvg_stoerung/1.0",
+}
+
+# Reused HTTP session: keep-alive skips a fresh TCP+TLS handshake per call,
+# and the retry policy backs off on transient server errors and rate limits
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    requests.adapters.HTTPAdapter(
+        pool_connections=1,
+        pool_maxsize=4,
+        max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504]),
+    ),
+)
+
+# Single alternation covering every HTML construct html_to_text knows about.
+# One compiled scan replaces the former chain of ~18 sequential re.sub passes,
+# so an input of length N is walked once instead of once per pattern. More
+# specific alternatives (emphasis, links) come before the catch-all tag group.
+_RE_HTML = re.compile(
+    r"(?P<strong><strong\b[^>]*>(?P<strong_text>.*?)</strong>)"
+    r"|(?P<b><b\b[^>]*>(?P<b_text>.*?)</b>)"
+    r"|(?P<em><em\b[^>]*>(?P<em_text>.*?)</em>)"
+    r"|(?P<i><i\b[^>]*>(?P<i_text>.*?)</i>)"
+    r"|(?P<link><a\s+[^>]*href=[\"'](?P<link_url>[^\"']*)[\"'][^>]*>(?P<link_text>.*?)</a>)"
+    r"|(?P<br><br\s*/?>)"
+    r"|(?P<hr><hr\s*/?>)"
+    r"|(?P<li><li\s*[^>]*>)"
+    r"|(?P<block><(?:p|div|ul|ol)\s*[^>]*>|</(?:p|div|ul|ol|li)>)"
+    r"|(?P<tag><[^>]+>)",
+    re.IGNORECASE | re.DOTALL,
+)
+
+_HR_RULE = "\n" + "-" * 50 + "\n"
+
+# Whitespace cleanup
+_RE_MULTI_NEWLINE = re.compile(r"\n\s*\n\s*\n")
+_RE_EDGE_WHITESPACE = re.compile(r"^\s+|\s+$")
+
+# Entities whose terminal-friendly ASCII replacement deliberately differs
+# from the Unicode character html.unescape would produce; everything else
+# (including numeric references) is handled by unescape afterwards
+_HTML_ENTITIES = {
+    "&nbsp;": " ",
+    "&hellip;": "...",
+    "&mdash;": "-",
+    "&ndash;": "-",
+    "&copy;": "(c)",
+    "&reg;": "(R)",
+    "&trade;": "(TM)",
+}
+
+# Single pattern matching every entity in _HTML_ENTITIES, so decoding is one
+# scan with a table lookup instead of one str.replace pass per entity.
+_RE_ENTITY = re.compile("|".join(re.escape(entity) for entity in _HTML_ENTITIES))
+
+
+# On-disk cache for conditional requests: the disruption feed changes rarely,
+# so a matching ETag turns a repeat invocation into a bodyless 304 round-trip
+_CACHE_DIR = os.path.join(os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"), "mvg_stoerung")
+_CACHE_BODY_FILE = os.path.join(_CACHE_DIR, "messages.json")
+_CACHE_ETAG_FILE = os.path.join(_CACHE_DIR, "messages.etag")
+
+
+def _read_cached_etag() -> Optional[str]:
+    """Return the ETag of the cached response, or None if the cache is unusable"""
+    try:
+        if not os.path.exists(_CACHE_BODY_FILE):
+            return None
+        with open(_CACHE_ETAG_FILE, encoding="utf-8") as f:
+            return f.read().strip() or None
+    except OSError:
+        return None
+
+
+def _load_cached_response() -> Dict[str, Any]:
+    """Parse and return the cached response body"""
+    with open(_CACHE_BODY_FILE, "rb") as f:
+        body = f.read()
+    if orjson is not None:
+        return orjson.loads(body)
+    return json.loads(body)
+
+
+def _store_cached_response(etag: str, body: bytes) -> None:
+    """Persist response body and ETag for the next conditional request"""
+    try:
+        os.makedirs(_CACHE_DIR, exist_ok=True)
+        for path, data in ((_CACHE_BODY_FILE, body), (_CACHE_ETAG_FILE, etag.encode("utf-8"))):
+            tmp_path = path + ".tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)  # atomic, so a crash never leaves a torn cache
+    except OSError:
+        # Caching is best-effort; a read-only home directory is not an error
+        pass
 
 
 def fetch_mvg_messages() -> Dict[str, Any]:
     """
     Fetch messages from MVG API
 
+    Sends a conditional request when a cached ETag exists and serves the
+    cached body on HTTP 304, skipping both download and parse of the payload.
+
     Returns:
         Dict containing the API response
 
@@ -25,22 +150,76 @@ def fetch_mvg_messages() -> Dict[str, Any]:
     """
     url = "https://www.mvg.de/api/bgw-pt/v3/messages"
 
+    headers = _HEADERS
+    etag = _read_cached_etag()
+    if etag:
+        headers = dict(_HEADERS)
+        headers["If-None-Match"] = etag
+
     try:
-        response = requests.get(url, timeout=10)
+        response = _SESSION.get(url, timeout=10, headers=headers)
+        if etag and response.status_code == 304:
+            try:
+                return _load_cached_response()
+            except (OSError, ValueError):
+                # Cache vanished or is corrupt: refetch unconditionally
+                response = _SESSION.get(url, timeout=10, headers=_HEADERS)
         response.raise_for_status()
-        return response.json()
+        if orjson is not None:
+            data = orjson.loads(response.content)
+        else:
+            data = response.json()
+        new_etag = response.headers.get("ETag")
+        if isinstance(new_etag, str) and isinstance(response.content, bytes):
+            _store_cached_response(new_etag, response.content)
+        return data
     except requests.RequestException as e:
         print(f"Error fetching data from MVG API: {e}", file=sys.stderr)
         raise
-    except json.JSONDecodeError as e:
+    except ValueError as e:
+        # Covers json.JSONDecodeError and orjson.JSONDecodeError alike
         print(f"Error parsing JSON response: {e}", file=sys.stderr)
         raise
 
 
+def _replace_html_match(match: "re.Match[str]") -> str:
+    """Return the terminal replacement for a single _RE_HTML match"""
+    if match.group("strong") is not None:
+        return "**" + _strip_html(match.group("strong_text")) + "**"
+    if match.group("b") is not None:
+        return "**" + _strip_html(match.group("b_text")) + "**"
+    if match.group("em") is not None:
+        return "*" + _strip_html(match.group("em_text")) + "*"
+    if match.group("i") is not None:
+        return "*" + _strip_html(match.group("i_text")) + "*"
+    if match.group("link") is not None:
+        # Keep the text, optionally show URL
+        return _strip_html(match.group("link_text")) + " (" + match.group("link_url") + ")"
+    if match.group("br") is not None:
+        return "\n"
+    if match.group("hr") is not None:
+        return _HR_RULE
+    if match.group("li") is not None:
+        return "- "
+    if match.group("block") is not None:
+        return "\n"
+    # Any remaining HTML tag is dropped
+    return ""
+
+
+def _strip_html(text: str) -> str:
+    """Convert HTML tags to terminal equivalents in a single pass over text"""
+    return _RE_HTML.sub(_replace_html_match, text)
+
+
+@lru_cache(maxsize=1024)
 def html_to_text(html_content: str) -> str:
     """
     Convert HTML content to terminal-friendly text
 
+    Results are cached: MVG boilerplate ("Liebe Fahrgäste", "Ihre MVG")
+    repeats across incidents, so identical inputs convert only once.
+
     Args:
         html_content: String containing HTML content
 
@@ -50,68 +229,38 @@ def html_to_text(html_content: str) -> str:
     if not html_content or not isinstance(html_content, str):
         return html_content
 
-    text = html_content
-
-    # Convert common HTML tags to terminal equivalents
-    text = re.sub(r"<br\s*/?>", "\n", text, flags=re.IGNORECASE)
-    text = re.sub(r"<p\s*[^>]*>", "\n", text, flags=re.IGNORECASE)
-    text = re.sub(r"</p>", "\n", text, flags=re.IGNORECASE)
-    text = re.sub(r"<div\s*[^>]*>", "\n", text, flags=re.IGNORECASE)
-    text = re.sub(r"</div>", "\n", text, flags=re.IGNORECASE)
-
-    # Convert line breaks and paragraphs
-    text = re.sub(r"<hr\s*/?>", "\n" + "-" * 50 + "\n", text, flags=re.IGNORECASE)
-
-    # Convert lists
-    text = re.sub(r"<ul\s*[^>]*>", "\n", text, flags=re.IGNORECASE)
-    text = re.sub(r"</ul>", "\n", text, flags=re.IGNORECASE)
-    text = re.sub(r"<ol\s*[^>]*>", "\n", text, flags=re.IGNORECASE)
-    text = re.sub(r"</ol>", "\n", text, flags=re.IGNORECASE)
-    text = re.sub(r"<li\s*[^>]*>", "- ", text, flags=re.IGNORECASE)
-    text = re.sub(r"</li>", "\n", text, flags=re.IGNORECASE)
-
-    # Convert emphasis tags
-    text = re.sub(r"<strong\s*[^>]*>(.*?)</strong>", r"**\1**", text, flags=re.IGNORECASE | re.DOTALL)
-    text = re.sub(r"<b\s*[^>]*>(.*?)</b>", r"**\1**", text, flags=re.IGNORECASE | re.DOTALL)
-    text = re.sub(r"<em\s*[^>]*>(.*?)</em>", r"*\1*", text, flags=re.IGNORECASE | re.DOTALL)
-    text = re.sub(r"<i\s*[^>]*>(.*?)</i>", r"*\1*", text, flags=re.IGNORECASE | re.DOTALL)
-
-    # Convert links (keep the text, optionally show URL)
-    text = re.sub(r'<a\s+[^>]*href=["\']([^"\']*)["\'][^>]*>(.*?)</a>', r"\2 (\1)", text, flags=re.IGNORECASE | re.DOTALL)
-
-    # Remove any remaining HTML tags
-    text = re.sub(r"<[^>]+>", "", text)
-
-    # Clean up whitespace
-    text = re.sub(r"\n\s*\n\s*\n", "\n\n", text)  # Replace multiple newlines with double newline
-    text = re.sub(r"^\s+|\s+$", "", text)  # Strip leading/trailing whitespace
-
-    # Decode common HTML entities
-    html_entities = {
-        "&amp;": "&",
-        "&lt;": "<",
-        "&gt;": ">",
-        "&quot;": '"',
-        "&apos;": "'",
-        "&nbsp;": " ",
-        "&hellip;": "...",
-        "&mdash;": "-",
-        "&ndash;": "-",
-        "&copy;": "(c)",
-        "&reg;": "(R)",
-        "&trade;": "(TM)",
-    }
-
-    for entity, replacement in html_entities.items():
-        text = text.replace(entity, replacement)
+    # Fast path: plain text without markup needs no processing at all
+    if "<" not in html_content and "&" not in html_content:
+        return html_content
+
+    # Convert known HTML tags and strip any remaining ones in one scan
+    if "<" in html_content:
+        text = _strip_html(html_content)
+
+        # Clean up whitespace
+        text = _RE_MULTI_NEWLINE.sub("\n\n", text)  # Replace multiple newlines with double newline
+        text = _RE_EDGE_WHITESPACE.sub("", text)  # Strip leading/trailing whitespace
+    else:
+        text = html_content
+
+    # Decode HTML entities: terminal-friendly overrides first, then the
+    # stdlib decoder for everything else (named and numeric references)
+    if "&" in text:
+        text = _RE_ENTITY.sub(lambda m: _HTML_ENTITIES[m.group(0)], text)
+        if "&" in text:
+            text = unescape(text)
 
     return text
 
 
+@lru_cache(maxsize=4096)
 def format_timestamp(timestamp: int) -> str:
     """
     Convert Unix timestamp (milliseconds) to German datetime format
 
+    Results are cached since the same publication/validity timestamps
+    repeat across incidents.
+
     Args:
         timestamp: Unix timestamp in milliseconds
 
@@ -119,112 +268,151 @@ def format_timestamp(timestamp: int) -> str:
         Formatted datetime string in German format
     """
     try:
-        # Convert milliseconds to seconds
-        dt = datetime.fromtimestamp(timestamp / 1000)
+        # Convert milliseconds to seconds and break into local-time fields.
+        # time.localtime is a single C call; formatting the fields directly
+        # avoids allocating a datetime object and parsing a strftime string.
+        t = _localtime(timestamp // 1000)
+        if not 1 <= t.tm_year <= 9999:
+            # Mirror datetime's supported range so absurd timestamps
+            # keep falling back to their string representation
+            return str(timestamp)
         # German datetime format: DD.MM.YYYY HH:MM
-        return dt.strftime("%d.%m.%Y %H:%M")
-    except (ValueError, OSError):
+        return f"{t.tm_mday:02d}.{t.tm_mon:02d}.{t.tm_year:04d} {t.tm_hour:02d}:{t.tm_min:02d}"
+    except (ValueError, OSError, OverflowError):
         return str(timestamp)
 
 
-def deduplicate_lines(incident: Dict[str, Any]) -> Dict[str, Any]:
-    """
-    Remove duplicate entries from the lines array
-
-    Args:
-        incident: Dictionary containing incident data
-
-    Returns:
-        Dictionary with deduplicated lines
-    """
-    # Create a copy to avoid modifying the original
-    converted = incident.copy()
-
+def _deduplicate_lines_inplace(converted: Dict[str, Any]) -> None:
+    """Replace the lines array of converted with a deduplicated copy"""
     if "lines" in converted and isinstance(converted["lines"], list):
         seen = set()
         unique_lines = []
+        seen_add = seen.add
+        unique_append = unique_lines.append
 
         for line in converted["lines"]:
             if isinstance(line, dict):
-                # Create a tuple of the line data for comparison
-                line_key = tuple(sorted(line.items()))
+                # Intern short string values: labels, transport types, and
+                # network names repeat across lines and incidents, so equal
+                # values collapse to one object whose hash is computed once
+                # and whose comparisons short-circuit on identity
+                for key, value in line.items():
+                    if type(value) is str and len(value) <= 32:
+                        line[key] = sys.intern(value)
+                # frozenset is order-independent, so no per-line sort is needed
+                try:
+                    line_key = frozenset(line.items())
+                except TypeError:
+                    # Unhashable values (nested dicts/lists): fall back to a
+                    # canonical JSON representation, tagged so it can never
+                    # collide with a plain string entry
+                    line_key = ("json", json.dumps(line, sort_keys=True, separators=(",", ":")))
                 if line_key not in seen:
-                    seen.add(line_key)
-                    unique_lines.append(line)
+                    seen_add(line_key)
+                    unique_append(line)
             else:
-                # For non-dict items, just check direct equality
-                if line not in unique_lines:
-                    unique_lines.append(line)
+                # Non-dict items dedup by value through the same seen set;
+                # only unhashable oddballs fall back to a direct list scan
+                try:
+                    if line not in seen:
+                        seen_add(line)
+                        unique_append(line)
+                except TypeError:
+                    if line not in unique_lines:
+                        unique_append(line)
 
         converted["lines"] = unique_lines
 
-    return converted
 
-
-def add_human_readable_dates(incident: Dict[str, Any]) -> Dict[str, Any]:
+def deduplicate_lines(incident: Dict[str, Any]) -> Dict[str, Any]:
     """
-    Add human-readable datetime fields to incident data
+    Remove duplicate entries from the lines array
 
     Args:
         incident: Dictionary containing incident data
 
     Returns:
-        Dictionary with additional human-readable datetime fields
+        Dictionary with deduplicated lines
     """
     # Create a copy to avoid modifying the original
     converted = incident.copy()
+    _deduplicate_lines_inplace(converted)
+    return converted
+
 
-    # Convert publication timestamp
-    if "publication" in converted and isinstance(converted["publication"], int):
-        converted["publication_readable"] = format_timestamp(converted["publication"])
+# The timezone database is consulted once per unique timestamp: format_timestamp
+# is lru_cached, so repeated values never reach this call again
+_localtime = time.localtime
 
-    # Convert validFrom and validTo timestamps
-    if "validFrom" in converted and isinstance(converted["validFrom"], int):
-        converted["validFrom_readable"] = format_timestamp(converted["validFrom"])
+# Payloads below this many incidents are processed serially; the thread pool
+# only pays for itself once there is enough per-incident work to overlap
+_PARALLEL_THRESHOLD = 64
 
-    if "validTo" in converted and isinstance(converted["validTo"], int):
-        converted["validTo_readable"] = format_timestamp(converted["validTo"])
+# Interned so the hot filter comparison can short-circuit on pointer equality
+# whenever the parser happens to return the interned string
+_INCIDENT_TYPE = sys.intern("INCIDENT")
+
+# Frozen set of message types kept by filter_incidents; a set membership test
+# stays O(1) if further disruption-like types ever need to be included
+_INCIDENT_TYPES = frozenset({_INCIDENT_TYPE})
+
+# Timestamp fields converted by _add_human_readable_dates_inplace
+_TS_FIELDS = ("publication", "validFrom", "validTo")
+_TS_SUBFIELDS = ("from", "to")
+
+
+def _add_human_readable_dates_inplace(converted: Dict[str, Any]) -> None:
+    """Add human-readable datetime fields to converted (nested dicts are copied)"""
+    # Convert top-level timestamps
+    for field in _TS_FIELDS:
+        value = converted.get(field)
+        if type(value) is int:
+            converted[field + "_readable"] = format_timestamp(value)
 
     # Convert publicationDuration timestamps
-    if "publicationDuration" in converted and isinstance(converted["publicationDuration"], dict):
-        duration = converted["publicationDuration"].copy()
-        if "from" in duration and isinstance(duration["from"], int):
-            duration["from_readable"] = format_timestamp(duration["from"])
-        if "to" in duration and isinstance(duration["to"], int):
-            duration["to_readable"] = format_timestamp(duration["to"])
+    duration = converted.get("publicationDuration")
+    if isinstance(duration, dict):
+        duration = duration.copy()
+        for subfield in _TS_SUBFIELDS:
+            value = duration.get(subfield)
+            if type(value) is int:
+                duration[subfield + "_readable"] = format_timestamp(value)
         converted["publicationDuration"] = duration
 
     # Convert incidentDurations timestamps
-    if "incidentDurations" in converted and isinstance(converted["incidentDurations"], list):
+    durations = converted.get("incidentDurations")
+    if isinstance(durations, list):
         converted_durations = []
-        for duration in converted["incidentDurations"]:
+        append = converted_durations.append
+        for duration in durations:
             if isinstance(duration, dict):
-                new_duration = duration.copy()
-                if "from" in new_duration and isinstance(new_duration["from"], int):
-                    new_duration["from_readable"] = format_timestamp(new_duration["from"])
-                if "to" in new_duration and isinstance(new_duration["to"], int):
-                    new_duration["to_readable"] = format_timestamp(new_duration["to"])
-                converted_durations.append(new_duration)
-            else:
-                converted_durations.append(duration)
+                duration = duration.copy()
+                for subfield in _TS_SUBFIELDS:
+                    value = duration.get(subfield)
+                    if type(value) is int:
+                        duration[subfield + "_readable"] = format_timestamp(value)
+            append(duration)
         converted["incidentDurations"] = converted_durations
 
-    return converted
-
 
-def convert_html_fields(incident: Dict[str, Any]) -> Dict[str, Any]:
+def add_human_readable_dates(incident: Dict[str, Any]) -> Dict[str, Any]:
     """
-    Convert HTML content in incident fields to terminal-friendly text
+    Add human-readable datetime fields to incident data
 
     Args:
         incident: Dictionary containing incident data
 
     Returns:
-        Dictionary with HTML converted to text in _readable fields
+        Dictionary with additional human-readable datetime fields
     """
     # Create a copy to avoid modifying the original
     converted = incident.copy()
+    _add_human_readable_dates_inplace(converted)
+    return converted
+
 
+def _convert_html_fields_inplace(converted: Dict[str, Any]) -> None:
+    """Add _readable variants of the HTML fields of converted"""
     # Convert description field if it exists - keep original and add readable version
     if "description" in converted and isinstance(converted["description"], str):
         converted["description_readable"] = html_to_text(converted["description"])
@@ -235,6 +423,34 @@ def convert_html_fields(incident: Dict[str, Any]) -> Dict[str, Any]:
         converted["title_readable"] = html_to_text(converted["title"])
         # Keep the original title as-is
 
+
+def convert_html_fields(incident: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Convert HTML content in incident fields to terminal-friendly text
+
+    Args:
+        incident: Dictionary containing incident data
+
+    Returns:
+        Dictionary with HTML converted to text in _readable fields
+    """
+    # Create a copy to avoid modifying the original
+    converted = incident.copy()
+    _convert_html_fields_inplace(converted)
+    return converted
+
+
+def _process_incident(incident: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Apply all per-incident transformations with a single top-level copy
+
+    Fuses convert_html_fields, add_human_readable_dates, and
+    deduplicate_lines so each incident is copied once instead of three times.
+    """
+    converted = incident.copy()
+    _convert_html_fields_inplace(converted)
+    _add_human_readable_dates_inplace(converted)
+    _deduplicate_lines_inplace(converted)
     return converted
 
 
@@ -248,8 +464,6 @@ def filter_incidents(data: Dict[str, Any]) -> List[Dict[str, Any]]:
     Returns:
         List of incident messages with HTML converted to text
     """
-    incidents = []
-
     # Handle different possible data structures
     messages = []
     if isinstance(data, list):
@@ -265,21 +479,20 @@ def filter_incidents(data: Dict[str, Any]) -> List[Dict[str, Any]]:
             if "type" in data:
                 messages = [data]
 
-    # Filter for INCIDENT type and convert HTML and timestamps
-    for message in messages:
-        if isinstance(message, dict) and message.get("type") == "INCIDENT":
-            # Convert HTML fields first
-            converted_incident = convert_html_fields(message)
-            # Then add human-readable dates
-            converted_incident = add_human_readable_dates(converted_incident)
-            # Finally deduplicate lines
-            converted_incident = deduplicate_lines(converted_incident)
-            incidents.append(converted_incident)
+    # Filter for INCIDENT type, then convert HTML and timestamps
+    candidates = [message for message in messages if isinstance(message, dict) and message.get("type") in _INCIDENT_TYPES]
 
-    return incidents
+    # Large payloads are processed on a small thread pool: the regex matching
+    # underneath _process_incident runs in C and overlaps across threads.
+    # Order is preserved by executor.map.
+    if len(candidates) > _PARALLEL_THRESHOLD:
+        with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 2)) as executor:
+            return list(executor.map(_process_incident, candidates, chunksize=16))
 
+    return [_process_incident(message) for message in candidates]
 
-def main():
+
+def main() -> None:
     """Main function to fetch and filter MVG incidents"""
     try:
         # Fetch data from API
@@ -289,8 +502,15 @@ def main():
         # Filter for incidents and convert HTML
         incidents = filter_incidents(data)
 
-        # Output results as JSON
-        print(json.dumps(incidents, indent=2, ensure_ascii=False))
+        # Output results as JSON; orjson serializes UTF-8 directly, matching
+        # the ensure_ascii=False output of the stdlib encoder
+        if orjson is not None:
+            output = orjson.dumps(incidents, option=orjson.OPT_INDENT_2).decode()
+        else:
+            output = json.dumps(incidents, indent=2, ensure_ascii=False)
+        # One write call for the whole payload instead of print's
+        # string handling plus separate newline write
+        sys.stdout.write(output + "\n")
 
         # Print summary to stderr
         print(f"Found {len(incidents)} incident(s)", file=sys.stderr)
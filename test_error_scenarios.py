@@ -6,178 +6,168 @@ Tests various failure modes, edge cases, and error handling
 
 import io
 import json
+import re
 import socket
 import ssl
-import sys
 import unittest
-from unittest.mock import MagicMock, Mock, patch
+from contextlib import redirect_stderr
+from unittest.mock import patch
 
 import requests
+import responses
 
 from mvg_stoerung import fetch_mvg_messages, filter_incidents, format_timestamp, html_to_text, main
 
+MVG_URL = "https://www.mvg.de/api/bgw-pt/v3/messages"
+
+# German datetime format DD.MM.YYYY HH:MM, compiled once for all assertions
+_DATE_RE = re.compile(r"\d{2}\.\d{2}\.\d{4} \d{2}:\d{2}")
+
 
 class TestNetworkFailures(unittest.TestCase):
     """Test various network failure scenarios"""
 
+    @responses.activate
     def test_connection_timeout(self):
         """Test connection timeout handling"""
-        with patch("mvg_stoerung.requests.get") as mock_get:
-            mock_get.side_effect = requests.Timeout("Connection timed out")
+        responses.add(responses.GET, MVG_URL, body=requests.Timeout("Connection timed out"))
 
-            with self.assertRaises(requests.Timeout):
-                fetch_mvg_messages()
+        with self.assertRaises(requests.Timeout):
+            fetch_mvg_messages()
 
+    @responses.activate
     def test_read_timeout(self):
         """Test read timeout handling"""
-        with patch("mvg_stoerung.requests.get") as mock_get:
-            mock_get.side_effect = requests.ReadTimeout("Read timed out")
+        responses.add(responses.GET, MVG_URL, body=requests.ReadTimeout("Read timed out"))
 
-            with self.assertRaises(requests.ReadTimeout):
-                fetch_mvg_messages()
+        with self.assertRaises(requests.ReadTimeout):
+            fetch_mvg_messages()
 
+    @responses.activate
     def test_connection_error(self):
         """Test connection error handling"""
-        with patch("mvg_stoerung.requests.get") as mock_get:
-            mock_get.side_effect = requests.ConnectionError("Failed to establish connection")
+        responses.add(responses.GET, MVG_URL, body=requests.ConnectionError("Failed to establish connection"))
 
-            with self.assertRaises(requests.ConnectionError):
-                fetch_mvg_messages()
+        with self.assertRaises(requests.ConnectionError):
+            fetch_mvg_messages()
 
+    @responses.activate
     def test_dns_resolution_failure(self):
         """Test DNS resolution failure"""
-        with patch("mvg_stoerung.requests.get") as mock_get:
-            mock_get.side_effect = socket.gaierror("Name or service not known")
+        responses.add(responses.GET, MVG_URL, body=socket.gaierror("Name or service not known"))
 
-            with self.assertRaises(socket.gaierror):
-                fetch_mvg_messages()
+        with self.assertRaises(socket.gaierror):
+            fetch_mvg_messages()
 
+    @responses.activate
     def test_ssl_certificate_error(self):
         """Test SSL certificate verification failure"""
-        with patch("mvg_stoerung.requests.get") as mock_get:
-            mock_get.side_effect = requests.exceptions.SSLError("SSL certificate verification failed")
+        responses.add(responses.GET, MVG_URL, body=requests.exceptions.SSLError("SSL certificate verification failed"))
 
-            with self.assertRaises(requests.exceptions.SSLError):
-                fetch_mvg_messages()
+        with self.assertRaises(requests.exceptions.SSLError):
+            fetch_mvg_messages()
 
+    @responses.activate
     def test_too_many_redirects(self):
         """Test too many redirects error"""
-        with patch("mvg_stoerung.requests.get") as mock_get:
-            mock_get.side_effect = requests.TooManyRedirects("Exceeded 30 redirects")
+        responses.add(responses.GET, MVG_URL, body=requests.TooManyRedirects("Exceeded 30 redirects"))
 
-            with self.assertRaises(requests.TooManyRedirects):
-                fetch_mvg_messages()
+        with self.assertRaises(requests.TooManyRedirects):
+            fetch_mvg_messages()
 
+    @responses.activate
     def test_proxy_error(self):
         """Test proxy connection error"""
-        with patch("mvg_stoerung.requests.get") as mock_get:
-            mock_get.side_effect = requests.exceptions.ProxyError("Cannot connect to proxy")
+        responses.add(responses.GET, MVG_URL, body=requests.exceptions.ProxyError("Cannot connect to proxy"))
 
-            with self.assertRaises(requests.exceptions.ProxyError):
-                fetch_mvg_messages()
+        with self.assertRaises(requests.exceptions.ProxyError):
+            fetch_mvg_messages()
 
 
 class TestHTTPErrors(unittest.TestCase):
     """Test HTTP error responses"""
 
+    @responses.activate
     def test_404_not_found(self):
         """Test 404 Not Found response"""
-        with patch("mvg_stoerung.requests.get") as mock_get:
-            mock_response = Mock()
-            mock_response.raise_for_status.side_effect = requests.HTTPError("404 Client Error: Not Found")
-            mock_get.return_value = mock_response
+        responses.add(responses.GET, MVG_URL, status=404)
 
-            with self.assertRaises(requests.HTTPError):
-                fetch_mvg_messages()
+        with self.assertRaises(requests.HTTPError):
+            fetch_mvg_messages()
 
+    @responses.activate
     def test_500_internal_server_error(self):
-        """Test 500 Internal Server Error"""
-        with patch("mvg_stoerung.requests.get") as mock_get:
-            mock_response = Mock()
-            mock_response.raise_for_status.side_effect = requests.HTTPError("500 Server Error: Internal Server Error")
-            mock_get.return_value = mock_response
+        """Test 500 Internal Server Error: retried, then surfaced as RetryError"""
+        responses.add(responses.GET, MVG_URL, status=500)
 
-            with self.assertRaises(requests.HTTPError):
-                fetch_mvg_messages()
+        # 500 is in the session's status_forcelist, so the adapter retries
+        # and raises RetryError once the attempts are exhausted
+        with self.assertRaises(requests.exceptions.RetryError):
+            fetch_mvg_messages()
 
+    @responses.activate
     def test_503_service_unavailable(self):
-        """Test 503 Service Unavailable"""
-        with patch("mvg_stoerung.requests.get") as mock_get:
-            mock_response = Mock()
-            mock_response.raise_for_status.side_effect = requests.HTTPError("503 Server Error: Service Unavailable")
-            mock_get.return_value = mock_response
+        """Test 503 Service Unavailable: retried, then surfaced as RetryError"""
+        responses.add(responses.GET, MVG_URL, status=503)
 
-            with self.assertRaises(requests.HTTPError):
-                fetch_mvg_messages()
+        # 503 is in the session's status_forcelist, so the adapter retries
+        # and raises RetryError once the attempts are exhausted
+        with self.assertRaises(requests.exceptions.RetryError):
+            fetch_mvg_messages()
 
+    @responses.activate
     def test_429_rate_limit_exceeded(self):
-        """Test 429 Too Many Requests"""
-        with patch("mvg_stoerung.requests.get") as mock_get:
-            mock_response = Mock()
-            mock_response.raise_for_status.side_effect = requests.HTTPError("429 Client Error: Too Many Requests")
-            mock_get.return_value = mock_response
+        """Test 429 Too Many Requests: retried, then surfaced as RetryError"""
+        responses.add(responses.GET, MVG_URL, status=429)
 
-            with self.assertRaises(requests.HTTPError):
-                fetch_mvg_messages()
+        # 429 is in the session's status_forcelist, so the adapter retries
+        # and raises RetryError once the attempts are exhausted
+        with self.assertRaises(requests.exceptions.RetryError):
+            fetch_mvg_messages()
 
+    @responses.activate
     def test_403_forbidden(self):
         """Test 403 Forbidden response"""
-        with patch("mvg_stoerung.requests.get") as mock_get:
-            mock_response = Mock()
-            mock_response.raise_for_status.side_effect = requests.HTTPError("403 Client Error: Forbidden")
-            mock_get.return_value = mock_response
+        responses.add(responses.GET, MVG_URL, status=403)
 
-            with self.assertRaises(requests.HTTPError):
-                fetch_mvg_messages()
+        with self.assertRaises(requests.HTTPError):
+            fetch_mvg_messages()
 
 
 class TestMalformedAPIResponses(unittest.TestCase):
     """Test various malformed API response scenarios"""
 
+    @responses.activate
     def test_invalid_json_syntax(self):
         """Test invalid JSON syntax"""
-        with patch("mvg_stoerung.requests.get") as mock_get:
-            mock_response = Mock()
-            mock_response.raise_for_status.return_value = None
-            mock_response.json.side_effect = json.JSONDecodeError("Expecting ',' delimiter", "", 10)
-            mock_get.return_value = mock_response
+        responses.add(responses.GET, MVG_URL, body='{"messages": [1 2]}', content_type="application/json")
 
-            with self.assertRaises(json.JSONDecodeError):
-                fetch_mvg_messages()
+        with self.assertRaises(json.JSONDecodeError):
+            fetch_mvg_messages()
 
+    @responses.activate
     def test_truncated_json(self):
         """Test truncated JSON response"""
-        with patch("mvg_stoerung.requests.get") as mock_get:
-            mock_response = Mock()
-            mock_response.raise_for_status.return_value = None
-            mock_response.json.side_effect = json.JSONDecodeError("Unterminated string", "", 50)
-            mock_get.return_value = mock_response
+        responses.add(responses.GET, MVG_URL, body='{"messages": [{"title": "Unterminated', content_type="application/json")
 
-            with self.assertRaises(json.JSONDecodeError):
-                fetch_mvg_messages()
+        with self.assertRaises(json.JSONDecodeError):
+            fetch_mvg_messages()
 
+    @responses.activate
     def test_empty_response_body(self):
         """Test empty response body"""
-        with patch("mvg_stoerung.requests.get") as mock_get:
-            mock_response = Mock()
-            mock_response.raise_for_status.return_value = None
-            mock_response.json.side_effect = json.JSONDecodeError("Expecting value", "", 0)
-            mock_get.return_value = mock_response
+        responses.add(responses.GET, MVG_URL, body="", content_type="application/json")
 
-            with self.assertRaises(json.JSONDecodeError):
-                fetch_mvg_messages()
+        with self.assertRaises(json.JSONDecodeError):
+            fetch_mvg_messages()
 
+    @responses.activate
     def test_non_json_content_type(self):
         """Test non-JSON content type response"""
-        with patch("mvg_stoerung.requests.get") as mock_get:
-            mock_response = Mock()
-            mock_response.raise_for_status.return_value = None
-            mock_response.json.side_effect = json.JSONDecodeError("Expecting value", "", 0)
-            mock_response.headers = {"content-type": "text/html"}
-            mock_get.return_value = mock_response
+        responses.add(responses.GET, MVG_URL, body="<html>maintenance</html>", content_type="text/html")
 
-            with self.assertRaises(json.JSONDecodeError):
-                fetch_mvg_messages()
+        with self.assertRaises(json.JSONDecodeError):
+            fetch_mvg_messages()
 
     def test_null_response(self):
         """Test null JSON response"""
@@ -365,7 +355,7 @@ class TestMainFunctionErrorHandling(unittest.TestCase):
 
             captured_stderr = io.StringIO()
 
-            with patch("sys.stderr", captured_stderr):
+            with redirect_stderr(captured_stderr):
                 with self.assertRaises(SystemExit) as cm:
                     main()
 
@@ -381,7 +371,7 @@ class TestMainFunctionErrorHandling(unittest.TestCase):
 
             captured_stderr = io.StringIO()
 
-            with patch("sys.stderr", captured_stderr):
+            with redirect_stderr(captured_stderr):
                 with self.assertRaises(SystemExit) as cm:
                     main()
 
@@ -397,7 +387,7 @@ class TestMainFunctionErrorHandling(unittest.TestCase):
 
             captured_stderr = io.StringIO()
 
-            with patch("sys.stderr", captured_stderr):
+            with redirect_stderr(captured_stderr):
                 with self.assertRaises(SystemExit) as cm:
                     main()
 
@@ -420,16 +410,16 @@ class TestEdgeCaseTimestamps(unittest.TestCase):
                 # Negative timestamps are processed as valid dates before Unix epoch
                 # Should return a formatted date string
                 self.assertIsInstance(result, str)
-                self.assertRegex(result, r"\d{2}\.\d{2}\.\d{4} \d{2}:\d{2}")
+                self.assertRegex(result, _DATE_RE)
 
     def test_zero_and_epoch_timestamps(self):
         """Test zero and epoch timestamps"""
         result_zero = format_timestamp(0)
-        self.assertRegex(result_zero, r"\d{2}\.\d{2}\.\d{4} \d{2}:\d{2}")
+        self.assertRegex(result_zero, _DATE_RE)
 
         # Unix epoch (January 1, 1970)
         result_epoch = format_timestamp(1000)  # 1 second after epoch
-        self.assertRegex(result_epoch, r"\d{2}\.\d{2}\.\d{4} \d{2}:\d{2}")
+        self.assertRegex(result_epoch, _DATE_RE)
 
     def test_far_future_timestamps(self):
         """Test far future timestamp values"""
@@ -6,18 +6,29 @@ Tests the full API workflow including real API calls and end-to-end functionalit
 
 import io
 import json
-import sys
+import os
+import re
+import tempfile
 import unittest
+from contextlib import redirect_stderr, redirect_stdout
 from unittest.mock import Mock, patch
 
 import requests
+import responses
 
+import mvg_stoerung
 from mvg_stoerung import fetch_mvg_messages, filter_incidents, main
 
+MVG_URL = "https://www.mvg.de/api/bgw-pt/v3/messages"
+
+# German datetime format DD.MM.YYYY HH:MM, compiled once for all assertions
+_DATE_RE = re.compile(r"\d{2}\.\d{2}\.\d{4} \d{2}:\d{2}")
+
 
 class TestMVGAPIIntegration(unittest.TestCase):
     """Test integration with the real MVG API"""
 
+    @unittest.skipUnless(os.environ.get("MVG_LIVE"), "live API test disabled; set MVG_LIVE=1 to enable")
     def test_real_api_call(self):
         """Test actual API call to MVG (with timeout for CI)"""
         try:
@@ -45,42 +56,75 @@ class TestMVGAPIIntegration(unittest.TestCase):
         except Exception as e:
             self.fail(f"Unexpected error during API call: {e}")
 
+    @responses.activate
     def test_api_timeout_handling(self):
         """Test API timeout handling"""
-        with patch("mvg_stoerung.requests.get") as mock_get:
-            mock_get.side_effect = requests.Timeout("Connection timeout")
+        responses.add(responses.GET, MVG_URL, body=requests.Timeout("Connection timeout"))
 
-            with self.assertRaises(requests.Timeout):
-                fetch_mvg_messages()
+        with self.assertRaises(requests.Timeout):
+            fetch_mvg_messages()
 
+    @responses.activate
     def test_api_http_error_handling(self):
         """Test HTTP error handling"""
-        with patch("mvg_stoerung.requests.get") as mock_get:
-            mock_response = Mock()
-            mock_response.raise_for_status.side_effect = requests.HTTPError("404 Not Found")
-            mock_get.return_value = mock_response
-
-            with self.assertRaises(requests.HTTPError):
-                fetch_mvg_messages()
-
+        responses.add(responses.GET, MVG_URL, status=404)
+
+        with self.assertRaises(requests.HTTPError):
+            fetch_mvg_messages()
+
+    def test_etag_conditional_cache(self):
+        """Test that a 304 response is served from the on-disk cache"""
+        with tempfile.TemporaryDirectory() as cache_dir:
+            body_file = os.path.join(cache_dir, "messages.json")
+            etag_file = os.path.join(cache_dir, "messages.etag")
+
+            with patch.object(mvg_stoerung, "_CACHE_DIR", cache_dir), patch.object(
+                mvg_stoerung, "_CACHE_BODY_FILE", body_file
+            ), patch.object(mvg_stoerung, "_CACHE_ETAG_FILE", etag_file):
+                # First fetch: 200 with an ETag populates the cache
+                with patch("mvg_stoerung._SESSION.get") as mock_get:
+                    mock_response = Mock()
+                    mock_response.status_code = 200
+                    mock_response.raise_for_status.return_value = None
+                    mock_response.json.return_value = {"messages": []}
+                    mock_response.content = b'{"messages": []}'
+                    mock_response.headers = {"ETag": 'W/"abc123"'}
+                    mock_get.return_value = mock_response
+
+                    data = fetch_mvg_messages()
+                    self.assertEqual(data, {"messages": []})
+
+                self.assertTrue(os.path.exists(body_file))
+                self.assertTrue(os.path.exists(etag_file))
+
+                # Second fetch: 304 is answered from the cached body
+                with patch("mvg_stoerung._SESSION.get") as mock_get:
+                    mock_response = Mock()
+                    mock_response.status_code = 304
+                    mock_get.return_value = mock_response
+
+                    data = fetch_mvg_messages()
+                    self.assertEqual(data, {"messages": []})
+
+                    sent_headers = mock_get.call_args.kwargs["headers"]
+                    self.assertEqual(sent_headers["If-None-Match"], 'W/"abc123"')
+
+    @responses.activate
     def test_api_json_decode_error(self):
         """Test JSON decode error handling"""
-        with patch("mvg_stoerung.requests.get") as mock_get:
-            mock_response = Mock()
-            mock_response.raise_for_status.return_value = None
-            mock_response.json.side_effect = json.JSONDecodeError("Invalid JSON", "", 0)
-            mock_get.return_value = mock_response
+        responses.add(responses.GET, MVG_URL, body="not json", content_type="application/json")
 
-            with self.assertRaises(json.JSONDecodeError):
-                fetch_mvg_messages()
+        with self.assertRaises(json.JSONDecodeError):
+            fetch_mvg_messages()
 
 
 class TestEndToEndWorkflow(unittest.TestCase):
     """Test complete end-to-end workflow"""
 
-    def setUp(self):
-        """Set up test data"""
-        self.sample_api_response = {
+    @classmethod
+    def setUpClass(cls):
+        """Set up test data once for the whole class (tests only read it)"""
+        cls.sample_api_response = {
             "messages": [
                 {
                     "title": "Test <strong>Incident</strong>",
@@ -139,7 +183,7 @@ class TestEndToEndWorkflow(unittest.TestCase):
             self.assertEqual(len(incident["lines"]), 2)  # Duplicate removed
 
             # Verify timestamp format (German)
-            self.assertRegex(incident["publication_readable"], r"\d{2}\.\d{2}\.\d{4} \d{2}:\d{2}")
+            self.assertRegex(incident["publication_readable"], _DATE_RE)
 
     def test_main_function_with_mock(self):
         """Test the main function with mocked API response"""
@@ -150,7 +194,7 @@ class TestEndToEndWorkflow(unittest.TestCase):
             captured_stdout = io.StringIO()
             captured_stderr = io.StringIO()
 
-            with patch("sys.stdout", captured_stdout), patch("sys.stderr", captured_stderr):
+            with redirect_stdout(captured_stdout), redirect_stderr(captured_stderr):
                 try:
                     main()
                 except SystemExit:
@@ -191,7 +235,7 @@ class TestErrorScenarios(unittest.TestCase):
 
             captured_stderr = io.StringIO()
 
-            with patch("sys.stderr", captured_stderr):
+            with redirect_stderr(captured_stderr):
                 with self.assertRaises(SystemExit):
                     main()
 
@@ -206,7 +250,7 @@ class TestErrorScenarios(unittest.TestCase):
             captured_stdout = io.StringIO()
             captured_stderr = io.StringIO()
 
-            with patch("sys.stdout", captured_stdout), patch("sys.stderr", captured_stderr):
+            with redirect_stdout(captured_stdout), redirect_stderr(captured_stderr):
                 main()
 
             # Should handle empty response gracefully
@@ -226,7 +270,7 @@ class TestErrorScenarios(unittest.TestCase):
             captured_stdout = io.StringIO()
             captured_stderr = io.StringIO()
 
-            with patch("sys.stdout", captured_stdout), patch("sys.stderr", captured_stderr):
+            with redirect_stdout(captured_stdout), redirect_stderr(captured_stderr):
                 main()
 
             # Should handle gracefully and return empty list
@@ -261,7 +305,7 @@ class TestErrorScenarios(unittest.TestCase):
 
             captured_stdout = io.StringIO()
 
-            with patch("sys.stdout", captured_stdout):
+            with redirect_stdout(captured_stdout):
                 main()
 
             # Should process what it can
@@ -291,7 +335,7 @@ class TestDataValidation(unittest.TestCase):
 
             captured_stdout = io.StringIO()
 
-            with patch("sys.stdout", captured_stdout):
+            with redirect_stdout(captured_stdout):
                 main()
 
             stdout_content = captured_stdout.getvalue()
@@ -301,9 +345,10 @@ class TestDataValidation(unittest.TestCase):
             self.assertIn("äöüß", incident["title"])
             self.assertIn("Züge fahren nicht.\nEntschuldigung", incident["description_readable"])
 
-    def test_large_dataset_handling(self):
-        """Test handling of large number of incidents"""
-        large_response = {
+    @classmethod
+    def setUpClass(cls):
+        """Build the 100-incident dataset once for the whole class"""
+        cls.large_response = {
             "messages": [
                 {
                     "title": f"Incident {i}",
@@ -318,13 +363,15 @@ class TestDataValidation(unittest.TestCase):
             ]
         }
 
+    def test_large_dataset_handling(self):
+        """Test handling of large number of incidents"""
         with patch("mvg_stoerung.fetch_mvg_messages") as mock_fetch:
-            mock_fetch.return_value = large_response
+            mock_fetch.return_value = self.large_response
 
             captured_stdout = io.StringIO()
             captured_stderr = io.StringIO()
 
-            with patch("sys.stdout", captured_stdout), patch("sys.stderr", captured_stderr):
+            with redirect_stdout(captured_stdout), redirect_stderr(captured_stderr):
                 main()
 
             stderr_content = captured_stderr.getvalue()
@@ -357,7 +404,7 @@ class TestDataValidation(unittest.TestCase):
 
             captured_stdout = io.StringIO()
 
-            with patch("sys.stdout", captured_stdout):
+            with redirect_stdout(captured_stdout):
                 main()
 
             stdout_content = captured_stdout.getvalue()
@@ -373,12 +420,10 @@ class TestDataValidation(unittest.TestCase):
 class TestPerformance(unittest.TestCase):
     """Test performance characteristics"""
 
-    def test_processing_time(self):
-        """Test that processing completes in reasonable time"""
-        import time
-
-        # Create a moderately large dataset
-        large_response = {
+    @classmethod
+    def setUpClass(cls):
+        """Build a moderately large dataset once for the whole class"""
+        cls.large_response = {
             "messages": [
                 {
                     "title": f"Incident {i}",
@@ -391,16 +436,20 @@ class TestPerformance(unittest.TestCase):
             ]
         }
 
+    def test_processing_time(self):
+        """Test that processing completes in reasonable time"""
+        import time
+
         with patch("mvg_stoerung.fetch_mvg_messages") as mock_fetch:
-            mock_fetch.return_value = large_response
+            mock_fetch.return_value = self.large_response
 
-            start_time = time.time()
+            start_time = time.perf_counter()
 
             captured_stdout = io.StringIO()
-            with patch("sys.stdout", captured_stdout):
+            with redirect_stdout(captured_stdout):
                 main()
 
-            end_time = time.time()
+            end_time = time.perf_counter()
             processing_time = end_time - start_time
 
             # Should complete within reasonable time (adjust threshold as needed)
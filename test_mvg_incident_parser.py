@@ -4,11 +4,15 @@ Unit tests for MVG Incident Parser
 Tests HTML conversion, deduplication, and datetime formatting functions
 """
 
+import re
 import unittest
 from datetime import datetime
 
 from mvg_stoerung import add_human_readable_dates, convert_html_fields, deduplicate_lines, format_timestamp, html_to_text
 
+# German datetime format DD.MM.YYYY HH:MM, compiled once for all assertions
+_DATE_RE = re.compile(r"\d{2}\.\d{2}\.\d{4} \d{2}:\d{2}")
+
 
 class TestHtmlToText(unittest.TestCase):
     """Test HTML to text conversion functionality"""
@@ -54,6 +58,12 @@ class TestHtmlToText(unittest.TestCase):
         expected = 'Text with & < > " entities'
         self.assertEqual(html_to_text(html), expected)
 
+    def test_numeric_entities(self):
+        """Test numeric HTML entity conversion"""
+        html = "M&#252;nchen &#x2013; Hauptbahnhof"
+        expected = "München – Hauptbahnhof"
+        self.assertEqual(html_to_text(html), expected)
+
     def test_complex_html(self):
         """Test complex HTML with multiple tags"""
         html = "Dear passengers,<br><strong>Important:</strong> delays due to <em>heavy traffic</em>.<br>More info at <a href='https://mvg.de'>MVG website</a>."
@@ -194,7 +204,7 @@ class TestFormatTimestamp(unittest.TestCase):
         result = format_timestamp(timestamp)
 
         # Should be in German format DD.MM.YYYY HH:MM
-        self.assertRegex(result, r"\d{2}\.\d{2}\.\d{4} \d{2}:\d{2}")
+        self.assertRegex(result, _DATE_RE)
 
     def test_invalid_timestamp(self):
         """Test invalid timestamp handling"""
@@ -231,7 +241,7 @@ class TestAddHumanReadableDates(unittest.TestCase):
         self.assertIn("validTo_readable", result)
 
         # Should be in German format
-        self.assertRegex(result["publication_readable"], r"\d{2}\.\d{2}\.\d{4} \d{2}:\d{2}")
+        self.assertRegex(result["publication_readable"], _DATE_RE)
 
     def test_publication_duration_conversion(self):
         """Test publicationDuration nested timestamp conversion"""